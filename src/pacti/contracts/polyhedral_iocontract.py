@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, TypedDict, Union
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple, TypedDict, Union
 
 from pacti.iocontract import IoContract, IoContractCompound, NestedTermList, TacticStatistics, Var
 from pacti.terms.polyhedra import serializer
@@ -15,7 +16,34 @@ ser_contract = TypedDict(
     {"input_vars": List[str], "output_vars": List[str], "assumptions": List[ser_pt], "guarantees": List[ser_pt]},
 )
 
-TACTICS_ORDER = [1, 2, 3, 4, 5]  # noqa: WPS407
+TACTICS_ORDER: Tuple[int, ...] = (1, 2, 3, 4, 5)
+
+
+def _terms_to_machine_dicts(terms: List[PolyhedralTerm]) -> List[ser_pt]:
+    # PolyhedralTerm stores its constant and coefficients as floats already
+    return [
+        {"constant": term.constant, "coefficients": {var.name: coeff for var, coeff in term.variables.items()}}
+        for term in terms
+    ]
+
+
+def _machine_dicts_to_termlist(clauses: List[dict], kind: str, var_table: Dict[str, Var]) -> PolyhedralTermList:
+    if not all(isinstance(x, dict) for x in clauses):
+        raise ValueError(f"{kind} must be a list of dicts.")
+    return PolyhedralTermList(
+        [PolyhedralTerm({var_table[k]: v for k, v in x["coefficients"].items()}, x["constant"]) for x in clauses]
+    )
+
+
+def _machine_dict_var_table(contract: dict) -> Dict[str, Var]:
+    # Resolve each variable name of the contract to its Var once, rather than
+    # once per occurrence in the clauses.
+    names = dict.fromkeys(contract["input_vars"])
+    names.update(dict.fromkeys(contract["output_vars"]))
+    for clause in chain(contract["assumptions"], contract["guarantees"]):
+        if isinstance(clause, dict):
+            names.update(dict.fromkeys(clause["coefficients"]))
+    return {name: Var(name) for name in names}
 
 
 class PolyhedralIoContract(IoContract):
@@ -31,10 +59,8 @@ class PolyhedralIoContract(IoContract):
         Returns:
             A contract with `source_var` replaced by `target_var`.
         """
-        new_contract = self.copy()
-        for mapping in variable_mappings:
-            new_contract = new_contract.rename_variable(Var(mapping[0]), Var(mapping[1]))
-        return new_contract
+        # the renamings are applied in order, and the contract is built once
+        return self._rename_variables([(Var(source), Var(target)) for source, target in variable_mappings])
 
     def to_machine_dict(self) -> ser_contract:
         """
@@ -43,28 +69,11 @@ class PolyhedralIoContract(IoContract):
         Returns:
             A dictionary containing the contract's information.
         """
-        input_vars = [str(x) for x in self.inputvars]
-        output_vars = [str(x) for x in self.outputvars]
-        assumptions: List[ser_pt] = [
-            {
-                "constant": float(term.constant),
-                "coefficients": {str(k): float(v) for k, v in term.variables.items()},
-            }
-            for term in self.a.terms
-        ]
-        guarantees: List[ser_pt] = [
-            {
-                "constant": float(term.constant),
-                "coefficients": {str(k): float(v) for k, v in term.variables.items()},
-            }
-            for term in self.g.terms
-        ]
-
         return {
-            "input_vars": input_vars,
-            "output_vars": output_vars,
-            "assumptions": assumptions,
-            "guarantees": guarantees,
+            "input_vars": [x.name for x in self.inputvars],
+            "output_vars": [x.name for x in self.outputvars],
+            "assumptions": _terms_to_machine_dicts(self.a.terms),
+            "guarantees": _terms_to_machine_dicts(self.g.terms),
         }
 
     def to_dict(self) -> dict:
@@ -75,8 +84,8 @@ class PolyhedralIoContract(IoContract):
             A dictionary containing the contract's information.
         """
         c_temp = {}
-        c_temp["input_vars"] = [str(x) for x in self.inputvars]
-        c_temp["output_vars"] = [str(x) for x in self.outputvars]
+        c_temp["input_vars"] = [x.name for x in self.inputvars]
+        c_temp["output_vars"] = [x.name for x in self.outputvars]
         c_temp["assumptions"] = self.a.to_str_list()
         c_temp["guarantees"] = self.g.to_str_list()
         return c_temp
@@ -102,19 +111,12 @@ class PolyhedralIoContract(IoContract):
         Returns:
             A polyhedral contract built from the arguments provided.
         """
-        a: List[PolyhedralTerm] = []
-        if assumptions:
-            a = [item for x in assumptions for item in serializer.polyhedral_termlist_from_string(x)]
-
-        g: List[PolyhedralTerm] = []
-        if guarantees:
-            g = [item for x in guarantees for item in serializer.polyhedral_termlist_from_string(x)]
-
+        # the parser returns fresh lists of PolyhedralTerm instances
         return PolyhedralIoContract(
             input_vars=[Var(x) for x in input_vars],
             output_vars=[Var(x) for x in output_vars],
-            assumptions=PolyhedralTermList(a),
-            guarantees=PolyhedralTermList(g),
+            assumptions=PolyhedralTermList._from_owned(serializer.polyhedral_termlist_from_strings(assumptions or [])),
+            guarantees=PolyhedralTermList._from_owned(serializer.polyhedral_termlist_from_strings(guarantees or [])),
             simplify=simplify,
         )
 
@@ -139,31 +141,12 @@ class PolyhedralIoContract(IoContract):
             if kw not in contract:
                 raise ValueError(f"Passed dictionary does not have key {kw}.")
 
-        if all(isinstance(x, dict) for x in contract["assumptions"]):
-            a = PolyhedralTermList(
-                [
-                    PolyhedralTerm({Var(k): v for k, v in x["coefficients"].items()}, float(x["constant"]))
-                    for x in contract["assumptions"]
-                ]
-            )
-        else:
-            raise ValueError("Assumptions must be a list of dicts.")
-
-        if all(isinstance(x, dict) for x in contract["guarantees"]):
-            g = PolyhedralTermList(
-                [
-                    PolyhedralTerm({Var(k): v for k, v in x["coefficients"].items()}, float(x["constant"]))
-                    for x in contract["guarantees"]
-                ]
-            )
-        else:
-            raise ValueError("Guarantees must be a list of dicts.")
-
+        var_table = _machine_dict_var_table(contract)
         return PolyhedralIoContract(
-            input_vars=[Var(x) for x in contract["input_vars"]],
-            output_vars=[Var(x) for x in contract["output_vars"]],
-            assumptions=a,
-            guarantees=g,
+            input_vars=[var_table[x] for x in contract["input_vars"]],
+            output_vars=[var_table[x] for x in contract["output_vars"]],
+            assumptions=_machine_dicts_to_termlist(contract["assumptions"], "Assumptions", var_table),
+            guarantees=_machine_dicts_to_termlist(contract["guarantees"], "Guarantees", var_table),
             simplify=simplify,
         )
 
@@ -200,7 +183,7 @@ class PolyhedralIoContract(IoContract):
         other: PolyhedralIoContract,
         vars_to_keep: Optional[List[str]] = None,
         simplify: bool = True,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[PolyhedralIoContract, List[TacticStatistics]]:
         """Compose polyhedral contracts.
 
@@ -262,7 +245,7 @@ class PolyhedralIoContract(IoContract):
         other: PolyhedralIoContract,
         additional_inputs: Optional[List[Var]] = None,
         simplify: bool = True,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[PolyhedralIoContract, List[TacticStatistics]]:
         """Quotient polyhedral contracts with support for specifying the order of tactics and measuring their use.
 
@@ -307,7 +290,7 @@ class PolyhedralIoContract(IoContract):
             The optimal value of the objective in the context of the contract.
         """
         new_expr = expr + " <= 0"
-        variables = serializer.polyhedral_termlist_from_string(new_expr)[0].variables
+        variables = dict(serializer.polyhedral_termlist_from_string(new_expr)[0].variables)
         constraints: PolyhedralTermList = self.a | self.g
         return constraints.optimize(objective=variables, maximize=maximize)
 
@@ -379,17 +362,10 @@ class PolyhedralIoContractCompound(IoContractCompound):
         Returns:
             A polyhedral contract built from the arguments provided.
         """
-        a: List[PolyhedralTermList] = []
-        if assumptions:
-            for termlist_str in assumptions:
-                a_termlist = [item for x in termlist_str for item in serializer.polyhedral_termlist_from_string(x)]
-                a.append(PolyhedralTermList(a_termlist))
-
-        g: List[PolyhedralTermList] = []
-        if guarantees:
-            for termlist_str in guarantees:
-                g_termlist = [item for x in termlist_str for item in serializer.polyhedral_termlist_from_string(x)]
-                g.append(PolyhedralTermList(g_termlist))
+        # the parser returns fresh lists of PolyhedralTerm instances
+        to_termlist = serializer.polyhedral_termlist_from_strings
+        a = [PolyhedralTermList._from_owned(to_termlist(termlist_str)) for termlist_str in assumptions or []]
+        g = [PolyhedralTermList._from_owned(to_termlist(termlist_str)) for termlist_str in guarantees or []]
 
         return PolyhedralIoContractCompound(
             input_vars=[Var(x) for x in input_vars],
@@ -406,8 +382,8 @@ class PolyhedralIoContractCompound(IoContractCompound):
             A dictionary containing the contract's information.
         """
         c_temp = {}
-        c_temp["input_vars"] = [str(x) for x in self.inputvars]
-        c_temp["output_vars"] = [str(x) for x in self.outputvars]
+        c_temp["input_vars"] = [x.name for x in self.inputvars]
+        c_temp["output_vars"] = [x.name for x in self.outputvars]
         c_temp["assumptions"] = [x.to_str_list() for x in self.a.nested_termlist]
         c_temp["guarantees"] = [x.to_str_list() for x in self.g.nested_termlist]
         return c_temp
@@ -3,19 +3,53 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Generic, List, TypeVar, Union
+from itertools import chain
+from typing import Dict, FrozenSet, Generic, List, Optional, Tuple, Type, TypeVar, Union
 
 from pacti.iocontract.iocontract import TermList_t, Var
-from pacti.utils.lists import list_diff, list_intersection, list_union
+from pacti.utils.lists import list_duplicates
 
 NestedTermlist_t = TypeVar("NestedTermlist_t", bound="NestedTermList")
 IoContractCompound_t = TypeVar("IoContractCompound_t", bound="IoContractCompound")
 numeric = Union[int, float]
 
 
-class NestedTermList:
+def _independent_supports(support1: FrozenSet[Var], support2: FrozenSet[Var]) -> bool:
+    # Termlists over disjoint variables constrain independent dimensions, so their
+    # intersection is empty exactly when one of them is. Termlists without
+    # variables are left out: the emptiness of constant-only terms is only
+    # detected when they are checked together with other constraints.
+    return bool(support1) and bool(support2) and support1.isdisjoint(support2)
+
+
+def _check_empty_intersections(nested_termlist: List[TermList_t]) -> None:
+    # The emptiness of termlists with independent supports is checked once per
+    # termlist instead of once per pair.
+    supports = [tl.vars_set for tl in nested_termlist]
+    emptiness: Dict[int, bool] = {}
+
+    def is_empty(index: int) -> bool:
+        if index not in emptiness:
+            emptiness[index] = nested_termlist[index].is_empty()
+        return emptiness[index]
+
+    for i, tli in enumerate(nested_termlist):
+        for j in range(i + 1, len(nested_termlist)):
+            tlj = nested_termlist[j]
+            if _independent_supports(supports[i], supports[j]):
+                empty_intersection = is_empty(i) or is_empty(j)
+            else:
+                empty_intersection = (tli | tlj).is_empty()
+            if not empty_intersection:
+                raise ValueError("Terms %s and %s have nonempty intersection" % (tli, tlj))
+
+
+class NestedTermList(Generic[TermList_t]):
     """A collection of termlists interpreted as their disjunction."""
 
+    # whether the termlists are known to be pairwise disjoint
+    _disjoint: bool
+
     def __init__(  # noqa: WPS231 too much cognitive complexity
         self, nested_termlist: List[TermList_t], force_empty_intersection: bool
     ):
@@ -31,38 +65,80 @@ class NestedTermList:
         """
         # make sure the elements of the argument don't intersect
         if force_empty_intersection:
-            for i, tli in enumerate(nested_termlist):
-                for j, tlj in enumerate(nested_termlist):
-                    if j > i:
-                        intersection = tli | tlj
-                        if not intersection.is_empty():
-                            raise ValueError("Terms %s and %s have nonempty intersection" % (tli, tlj))
-        self.nested_termlist: List[TermList_t] = []
-        for tl in nested_termlist:
-            self.nested_termlist.append(tl.copy())
+            _check_empty_intersections(nested_termlist)
+        self.nested_termlist = [tl.copy() for tl in nested_termlist]
+        self._disjoint = self._disjoint or force_empty_intersection
+
+    @classmethod
+    def _from_owned(
+        cls: Type[NestedTermlist_t],
+        nested_termlist: List[TermList_t],
+        force_empty_intersection: bool,
+        disjoint: bool = False,
+    ) -> NestedTermlist_t:
+        """
+        Build a nested termlist that takes ownership of freshly created termlists.
+
+        Neither the list nor its termlists are copied, so they must not be shared
+        with any other object.
+
+        Args:
+            nested_termlist: A list of termlists not referenced anywhere else.
+            force_empty_intersection: Raise error if the termlists are not disjoint.
+            disjoint: The caller knows the termlists to be disjoint, so they need not be checked.
+
+        Returns:
+            A nested termlist wrapping `nested_termlist`.
+        """
+        if force_empty_intersection and not disjoint:
+            _check_empty_intersections(nested_termlist)
+        that = cls.__new__(cls)
+        that.nested_termlist = nested_termlist
+        that._disjoint = that._disjoint or disjoint or force_empty_intersection
+        return that
+
+    @property
+    def nested_termlist(self) -> List[TermList_t]:
+        """The termlists whose disjunction this object represents.
+
+        Returns:
+            The list of termlists.
+        """
+        return self._nested_termlist
+
+    @nested_termlist.setter
+    def nested_termlist(self, nested_termlist: List[TermList_t]) -> None:
+        # as for TermList.terms, assigning a new list drops the cached variables
+        # and what is known about the disjointness of the termlists
+        self._nested_termlist = nested_termlist
+        self._vars_cache: Optional[List[Var]] = None
+        self._disjoint = len(nested_termlist) <= 1
 
     def __str__(self) -> str:
         if self.nested_termlist:
-            res = [str(tl) for tl in self.nested_termlist]
-            return "\nor \n".join(res)
+            return "\nor \n".join(map(str, self.nested_termlist))
         return "true"
 
-    def __le__(self, other: object) -> bool:  # noqa: WPS231 too much cognitive complexity
+    def __le__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError()
+        other_tls = other.nested_termlist
         for this_tl in self.nested_termlist:
-            found = False
-            for that_tl in other.nested_termlist:
-                if this_tl <= that_tl:
-                    found = True
-                    break
-            if not found:
+            # A termlist whose terms all appear in this_tl contains it. Looking for
+            # one among all candidates first avoids solving for the others.
+            this_terms = set(this_tl.terms)
+            if any(this_terms.issuperset(that_tl.terms) for that_tl in other_tls):
+                continue
+            if not any(this_tl <= that_tl for that_tl in other_tls):
                 return False
         return True
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             raise ValueError()
+        # identical lists of termlists need no containment checks
+        if self.nested_termlist == other.nested_termlist:
+            return True
         return self <= other <= self
 
     def simplify(self: NestedTermlist_t, context: NestedTermlist_t, force_empty_intersection: bool) -> NestedTermlist_t:
@@ -82,12 +158,14 @@ class NestedTermList:
                 try:
                     new_tl = self_tl.simplify(context_tl)
                 except ValueError:
-                    new_tl = self_tl.copy()
+                    # self_tl is unsatisfiable in this context
                     continue
                 new_nested_tl.append(new_tl)
-        return type(self)(new_nested_tl, force_empty_intersection)
+        return self._from_owned(new_nested_tl, force_empty_intersection)
 
-    def intersect(self: NestedTermlist_t, other: NestedTermlist_t, force_empty_intersection: bool) -> NestedTermlist_t:
+    def intersect(  # noqa: WPS231 too much cognitive complexity
+        self: NestedTermlist_t, other: NestedTermlist_t, force_empty_intersection: bool
+    ) -> NestedTermlist_t:
         """
         Semantically intersect two nested termlists.
 
@@ -98,25 +176,46 @@ class NestedTermList:
         Returns:
             The nested termlist for the intersection.
         """
+        # Pairs with independent supports are nonempty exactly when both sides are,
+        # so they need no LP on their union; each side is checked at most once.
+        other_tls = other.nested_termlist
+        other_supports = [tl.vars_set for tl in other_tls]
+        other_emptiness: Dict[int, bool] = {}
         new_nested_tl = []
         for self_tl in self.nested_termlist:
-            for other_tl in other.nested_termlist:
+            self_support = self_tl.vars_set
+            self_empty: Optional[bool] = None
+            for j, other_tl in enumerate(other_tls):
+                if _independent_supports(self_support, other_supports[j]):
+                    if self_empty is None:
+                        self_empty = self_tl.is_empty()
+                    if j not in other_emptiness:
+                        other_emptiness[j] = other_tl.is_empty()
+                    if not self_empty and not other_emptiness[j]:
+                        new_nested_tl.append(self_tl | other_tl)
+                    continue
                 new_tl = self_tl | other_tl
                 if not new_tl.is_empty():
                     new_nested_tl.append(new_tl)
-        return type(self)(new_nested_tl, force_empty_intersection)
+        # Two intersections of disjuncts differ in the disjunct of self or in that of
+        # other, so they are disjoint whenever both arguments are known to be.
+        disjoint = self._disjoint and other._disjoint
+        return self._from_owned(new_nested_tl, force_empty_intersection, disjoint)
 
     @property
     def vars(self) -> List[Var]:  # noqa: A003
         """The list of variables contained in this nested termlist.
 
+        The list is computed on first access and cached until `nested_termlist`
+        is reassigned; callers must not modify it.
+
         Returns:
             List of variables referenced in nested termlist.
         """
-        varlist: List[Var] = []
-        for tl in self.nested_termlist:
-            varlist = list_union(varlist, tl.vars)
-        return varlist
+        if self._vars_cache is None:
+            # one ordered, duplicate-free pass over the cached variables of each termlist
+            self._vars_cache = list(dict.fromkeys(chain.from_iterable(tl.vars for tl in self.nested_termlist)))
+        return self._vars_cache
 
     def copy(self: NestedTermlist_t, force_empty_intersection: bool) -> NestedTermlist_t:
         """
@@ -128,7 +227,7 @@ class NestedTermList:
         Returns:
             Copy of nested termlist.
         """
-        return type(self)([tl.copy() for tl in self.nested_termlist], force_empty_intersection)
+        return self._from_owned([tl.copy() for tl in self.nested_termlist], force_empty_intersection, self._disjoint)
 
     def contains_behavior(self, behavior: Dict[Var, numeric]) -> bool:
         """
@@ -153,6 +252,58 @@ class NestedTermList:
         return False
 
 
+def _check_compound_io(
+    assumptions: NestedTermList, guarantees: NestedTermList, input_vars: List[Var], output_vars: List[Var]
+) -> Tuple[FrozenSet[Var], FrozenSet[Var]]:
+    """
+    Check that the arguments of a compound contract are consistent.
+
+    Args:
+        assumptions: The assumptions of the contract.
+        guarantees: The guarantees of the contract.
+        input_vars: The input variables of the contract.
+        output_vars: The output variables of the contract.
+
+    Returns:
+        The sets of input and output variables.
+
+    Raises:
+        ValueError: Arguments provided does not produce a valid IO contract.
+    """
+    logging.debug("Constructor assumptions\n%s", assumptions)
+    logging.debug("Constructor guarantees\n%s", guarantees)
+    # make sure the input and output variables have no repeated entries
+    input_set = set(input_vars)
+    output_set = set(output_vars)
+    if len(input_vars) != len(input_set):
+        raise ValueError(
+            "The following input variables appear multiple times in argument %s" % (list_duplicates(input_vars))
+        )
+    if len(output_vars) != len(output_set):
+        raise ValueError(
+            "The following output variables appear multiple times in argument %s" % (list_duplicates(output_vars))
+        )
+    # make sure the input & output variables are disjoint
+    if not input_set.isdisjoint(output_set):
+        raise ValueError(
+            "The following variables appear in inputs and outputs: %s"
+            % ([var for var in input_vars if var in output_set])
+        )
+    # make sure the assumptions only contain input variables
+    non_inputs = [var for var in assumptions.vars if var not in input_set]
+    if non_inputs:
+        raise ValueError("The following variables appear in the assumptions but are not inputs: %s" % (non_inputs))
+    # make sure the guarantees only contain input or output variables
+    non_io = [var for var in guarantees.vars if var not in input_set and var not in output_set]
+    if non_io:
+        raise ValueError(
+            "The guarantees contain the following variables which are neither"
+            "inputs nor outputs: %s. Inputs: %s. Outputs: %s. Guarantees: %s"
+            % (non_io, input_vars, output_vars, guarantees)
+        )
+    return frozenset(input_set), frozenset(output_set)
+
+
 class IoContractCompound(Generic[NestedTermlist_t]):
     """
     Basic type for a compound IO contract.
@@ -184,41 +335,7 @@ class IoContractCompound(Generic[NestedTermlist_t]):
         Raises:
             ValueError: Arguments provided does not produce a valid IO contract.
         """
-        logging.debug("Constructor assumptions")
-        logging.debug(assumptions)
-        logging.debug("Constructor guarantees")
-        logging.debug(guarantees)
-        # make sure the input and output variables have no repeated entries
-        if len(input_vars) != len(set(input_vars)):
-            raise ValueError(
-                "The following input variables appear multiple times in argument %s"
-                % (set(list_diff(input_vars, list(set(input_vars)))))
-            )
-        if len(output_vars) != len(set(output_vars)):
-            raise ValueError(
-                "The following output variables appear multiple times in argument %s"
-                % (set(list_diff(output_vars, list(set(output_vars)))))
-            )
-        # make sure the input & output variables are disjoint
-        if list_intersection(input_vars, output_vars):
-            raise ValueError(
-                "The following variables appear in inputs and outputs: %s"
-                % (list_intersection(input_vars, output_vars))
-            )
-        # make sure the assumptions only contain input variables
-        if list_diff(assumptions.vars, input_vars):
-            raise ValueError(
-                "The following variables appear in the assumptions but are not inputs: %s"
-                % (list_diff(assumptions.vars, input_vars))
-            )
-        # make sure the guarantees only contain input or output variables
-        if list_diff(guarantees.vars, list_union(input_vars, output_vars)):
-            raise ValueError(
-                "The guarantees contain the following variables which are neither"
-                "inputs nor outputs: %s. Inputs: %s. Outputs: %s. Guarantees: %s"
-                % (list_diff(guarantees.vars, list_union(input_vars, output_vars)), input_vars, output_vars, guarantees)
-            )
-
+        self._in_set, self._out_set = _check_compound_io(assumptions, guarantees, input_vars, output_vars)
         self.a: NestedTermlist_t = assumptions.copy(True)
         self.g: NestedTermlist_t = guarantees.copy(False)
         self.inputvars = input_vars.copy()
@@ -226,22 +343,44 @@ class IoContractCompound(Generic[NestedTermlist_t]):
         # simplify the guarantees with the assumptions
         # self.g = self.g.simplify(self.a)
 
+    @classmethod
+    def _from_owned(
+        cls: Type[IoContractCompound_t],
+        assumptions: NestedTermlist_t,
+        guarantees: NestedTermlist_t,
+        input_vars: List[Var],
+        output_vars: List[Var],
+    ) -> IoContractCompound_t:
+        """
+        Build a contract that takes ownership of freshly created arguments.
+
+        The arguments are validated as in the constructor but not copied, so they
+        must not be shared with any other object. The termlists of the
+        assumptions must already be known to be disjoint.
+
+        Args:
+            assumptions: The assumptions of the contract.
+            guarantees: The guarantees of the contract.
+            input_vars: The input variables of the contract.
+            output_vars: The output variables of the contract.
+
+        Returns:
+            A contract wrapping the given arguments.
+        """
+        in_set, out_set = _check_compound_io(assumptions, guarantees, input_vars, output_vars)
+        that = cls.__new__(cls)
+        that._in_set = in_set
+        that._out_set = out_set
+        that.a = assumptions
+        that.g = guarantees
+        that.inputvars = input_vars
+        that.outputvars = output_vars
+        return that
+
     def __str__(self) -> str:
-        return (
-            "InVars: "
-            + "["
-            + ", ".join([v.name for v in self.inputvars])
-            + "]"
-            + "\nOutVars:"
-            + "["
-            + ", ".join([v.name for v in self.outputvars])
-            + "]"
-            + "\nA: "
-            + str(self.a)
-            + "\n"
-            + "G: "
-            + str(self.g)
-        )
+        inputs = ", ".join(map(str, self.inputvars))
+        outputs = ", ".join(map(str, self.outputvars))
+        return f"InVars: [{inputs}]\nOutVars:[{outputs}]\nA: {self.a}\nG: {self.g}"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -266,8 +405,9 @@ class IoContractCompound(Generic[NestedTermlist_t]):
         Returns:
             The result of merging.
         """
-        input_vars = list_union(self.inputvars, other.inputvars)
-        output_vars = list_union(self.outputvars, other.outputvars)
+        input_vars = self.inputvars + [var for var in other.inputvars if var not in self._in_set]
+        output_vars = self.outputvars + [var for var in other.outputvars if var not in self._out_set]
+        # intersect builds fresh nested termlists and checks the assumptions are disjoint
         assumptions = self.a.intersect(other.a, force_empty_intersection=True)
         guarantees = self.g.intersect(other.g, force_empty_intersection=False)
-        return type(self)(assumptions, guarantees, input_vars, output_vars)
+        return self._from_owned(assumptions, guarantees, input_vars, output_vars)
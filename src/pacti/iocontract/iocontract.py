@@ -17,13 +17,14 @@ Term and TermList with specific constraint formalisms.
 """
 from __future__ import annotations
 
-import copy
 import logging
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from itertools import chain, count
+from typing import Any, FrozenSet, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
 
 from pacti.utils.errors import IncompatibleArgsError
-from pacti.utils.lists import list_diff, list_intersection, list_union, lists_equal
+from pacti.utils.lists import list_diff, list_duplicates, list_intersection, list_union, lists_disjoint
 
 Var_t = TypeVar("Var_t", bound="Var")
 Term_t = TypeVar("Term_t", bound="Term")
@@ -39,16 +40,45 @@ class Var:
     Variables used in system modeling.
 
     Variables allow us to name an entity for which we want to write constraints.
+
+    Variables are interned: constructing a `Var` with a name that is already
+    in use returns the existing instance, so two variables are equal exactly
+    when they are the same object. Each instance also carries an integer id
+    used as its hash. The intern table holds weak references, so variables
+    that are no longer used anywhere are released.
     """
 
-    def __init__(self, varname: str):
+    __slots__ = ("_name", "_id", "__weakref__")
+
+    _name: str
+    _id: int
+
+    _interned: weakref.WeakValueDictionary[str, Var] = weakref.WeakValueDictionary()  # noqa: WPS115
+    _ids = count()  # noqa: WPS115
+
+    def __new__(cls, varname: str) -> Var:
         """
         Constructor for Var.
 
         Args:
             varname: The name of the variable.
+
+        Returns:
+            The variable with the given name.
         """
-        self._name = str(varname)
+        name = str(varname)
+        var = cls._interned.get(name)  # noqa: VNE002
+        if var is None:
+            var = super().__new__(cls)  # noqa: VNE002
+            var._name = name
+            var._id = next(cls._ids)
+            var = cls._interned.setdefault(name, var)  # noqa: VNE002
+        return var
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        # Unpickle through the intern table only: the id is specific to the
+        # process, so restoring it would change the hash of a live variable.
+        return (Var, (self._name,))
 
     @property
     def name(self) -> str:
@@ -60,15 +90,17 @@ class Var:
         return self._name
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
+        if self is other:
+            return True
+        if not isinstance(other, Var):
             raise ValueError()
-        return self.name == other.name
+        return False
 
     def __str__(self) -> str:
         return self.name
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._id
 
     def __repr__(self) -> str:
         return "<Var {0}>".format(self.name)
@@ -79,14 +111,31 @@ class Term(ABC):
     Terms, or constraints, to be imposed on the system or components.
 
     Term is an abstract class that must be extended in order to support specific
-    constraint languages.
+    constraint languages. Terms are treated as immutable: operations return new
+    terms, so implementations may compute `vars` and their hash once.
+    Implementations are encouraged to declare `__slots__`, as large numbers of
+    terms are created during contract operations.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def vars(self) -> List[Var]:  # noqa: A003
         """Variables contained in the syntax of the term."""
 
+    @property
+    def vars_set(self) -> FrozenSet[Var]:
+        """
+        Variables contained in the syntax of the term, as a set.
+
+        Implementations should override this with a value computed once.
+
+        Returns:
+            Frozenset of the variables referenced in the term.
+        """
+        return frozenset(self.vars)
+
     @abstractmethod
     def contains_var(self, var_to_seek: Var) -> bool:
         """
@@ -156,25 +205,82 @@ class TermList(ABC):
         else:
             self.terms = []
 
+    @classmethod
+    def _from_owned(cls: Type[TermList_t], term_list: List) -> TermList_t:
+        """
+        Build a termlist that takes ownership of a freshly created list of terms.
+
+        The list is neither copied nor validated, so it must not be shared with
+        any other object.
+
+        Args:
+            term_list: A list of terms not referenced anywhere else.
+
+        Returns:
+            A termlist wrapping `term_list`.
+        """
+        that = cls.__new__(cls)
+        that.terms = term_list
+        return that
+
+    @property
+    def terms(self) -> List:
+        """The terms contained in this TermList.
+
+        Returns:
+            The list of terms.
+        """
+        return self._terms
+
+    @terms.setter
+    def terms(self, term_list: List) -> None:
+        # Derived data is cached per list of terms. Assigning a new list is the
+        # supported way of modifying a TermList, and it drops the caches.
+        self._terms = term_list
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        # Subclasses caching more data derived from the terms extend this method.
+        self._vars_cache: Optional[List[Var]] = None
+        self._vars_set_cache: Optional[FrozenSet[Var]] = None
+
     @property
     def vars(self) -> List[Var]:  # noqa: A003
         """The list of variables contained in this list of terms.
 
+        The list is computed on first access and cached until `terms` is
+        reassigned; callers must not modify it.
+
         Returns:
             List of variables referenced in the term.
         """
-        varlist: List[Var] = []
-        for t in self.terms:
-            varlist = list_union(varlist, t.vars)
-        return varlist
+        if self._vars_cache is None:
+            # one ordered, duplicate-free pass over the variables of all terms
+            self._vars_cache = list(dict.fromkeys(chain.from_iterable(t.vars for t in self.terms)))
+        return self._vars_cache
+
+    @property
+    def vars_set(self) -> FrozenSet[Var]:
+        """The variables contained in this list of terms, as a set.
+
+        Like `vars`, the set is computed on first access and cached until
+        `terms` is reassigned.
+
+        Returns:
+            Frozenset of the variables referenced in the terms.
+        """
+        if self._vars_set_cache is None:
+            self._vars_set_cache = frozenset(self.vars)
+        return self._vars_set_cache
 
     def __str__(self) -> str:
         if self.terms:
-            res = [str(el) for el in self.terms]
-            return ", ".join(res)
+            return ", ".join(map(str, self.terms))
         return "true"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             raise ValueError()
         return self.terms == other.terms
@@ -189,20 +295,37 @@ class TermList(ABC):
         Returns:
             The list of terms which contain any of the variables indicated.
         """
-        terms = []
-        for t in self.terms:
-            if list_intersection(t.vars, variable_list):
-                terms.append(t)
-        return type(self)(terms)
+        variable_set = frozenset(variable_list)
+        if variable_set.isdisjoint(self.vars_set):
+            return self._from_owned([])
+        return self._from_owned([t for t in self.terms if not variable_set.isdisjoint(t.vars_set)])
+
+    def remove_terms_with_vars(self: TermList_t, variable_list: List[Var]) -> TermList_t:
+        """
+        Returns the list of terms which contain none of the variables indicated.
+
+        This is equivalent to `self - self.get_terms_with_vars(variable_list)`,
+        computed in a single pass.
+
+        Args:
+            variable_list: a list of variables whose terms are removed.
+
+        Returns:
+            The list of terms which contain none of the variables indicated.
+        """
+        variable_set = frozenset(variable_list)
+        if variable_set.isdisjoint(self.vars_set):
+            return self.copy()
+        return self._from_owned([t for t in self.terms if variable_set.isdisjoint(t.vars_set)])
 
     def __and__(self: TermList_t, other: TermList_t) -> TermList_t:
-        return type(self)(list_intersection(self.copy().terms, other.copy().terms))
+        return self._from_owned(list_intersection(self.terms, other.terms))
 
     def __or__(self: TermList_t, other: TermList_t) -> TermList_t:
-        return type(self)(list_union(self.copy().terms, other.copy().terms))
+        return self._from_owned(list_union(self.terms, other.terms))
 
     def __sub__(self: TermList_t, other: TermList_t) -> TermList_t:
-        return type(self)(list_diff(self.copy().terms, other.copy().terms))
+        return self._from_owned(list_diff(self.terms, other.terms))
 
     def __le__(self: TermList_t, other: TermList_t) -> bool:
         return self.refines(other)
@@ -218,7 +341,12 @@ class TermList(ABC):
         Returns:
             Copy of termlist.
         """
-        return type(self)([term.copy() for term in self.terms])
+        # Terms are immutable, so the copy can share them, along with the
+        # variables computed from them.
+        that = self._from_owned(self.terms[:])
+        that._vars_cache = self._vars_cache
+        that._vars_set_cache = self._vars_set_cache
+        return that
 
     def rename_variable(self: TermList_t, source_var: Var, target_var: Var) -> TermList_t:
         """
@@ -231,7 +359,7 @@ class TermList(ABC):
         Returns:
             A termlist with `source_var` replaced by `target_var`.
         """
-        return type(self)([term.rename_variable(source_var, target_var) for term in self.terms])
+        return self._from_owned([term.rename_variable(source_var, target_var) for term in self.terms])
 
     @abstractmethod
     def contains_behavior(self, behavior: Any) -> bool:
@@ -251,7 +379,7 @@ class TermList(ABC):
 
     @abstractmethod
     def elim_vars_by_refining(
-        self: TermList_t, context: TermList_t, vars_to_elim: List[Var], simplify: bool, tactics_order: List[int]
+        self: TermList_t, context: TermList_t, vars_to_elim: List[Var], simplify: bool, tactics_order: Sequence[int]
     ) -> Tuple[TermList_t, TacticStatistics]:
         """
         Eliminate variables from termlist by refining it in a context.
@@ -280,7 +408,7 @@ class TermList(ABC):
 
     @abstractmethod
     def elim_vars_by_relaxing(
-        self: TermList_t, context: TermList_t, vars_to_elim: List[Var], simplify: bool, tactics_order: List[int]
+        self: TermList_t, context: TermList_t, vars_to_elim: List[Var], simplify: bool, tactics_order: Sequence[int]
     ) -> Tuple[TermList_t, TacticStatistics]:
         """
         Eliminate variables from termlist by relaxing it in a context
@@ -327,6 +455,9 @@ class TermList(ABC):
         """
         Tell whether the argument is a larger specification.
 
+        Every termlist refines itself; implementations should return early
+        when `other` is `self` instead of running a containment check.
+
         Args:
             other:
                 TermList against which we are comparing self.
@@ -382,40 +513,44 @@ class IoContract(Generic[TermList_t]):
         Raises:
             IncompatibleArgsError: Arguments provided does not produce a valid IO contract.
         """
+        # Each check computes the offending variables once, in argument order;
+        # they are empty when the check passes.
+        input_set = set(input_vars)
+        output_set = set(output_vars)
         # make sure the input and output variables have no repeated entries
-        if len(input_vars) != len(set(input_vars)):
+        if len(input_vars) != len(input_set):
             raise IncompatibleArgsError(
-                "The following input variables appear multiple times in argument %s"
-                % (set(list_diff(input_vars, list(set(input_vars)))))
+                "The following input variables appear multiple times in argument %s" % (list_duplicates(input_vars))
             )
-        if len(output_vars) != len(set(output_vars)):
+        if len(output_vars) != len(output_set):
             raise IncompatibleArgsError(
-                "The following output variables appear multiple times in argument %s"
-                % (set(list_diff(output_vars, list(set(output_vars)))))
+                "The following output variables appear multiple times in argument %s" % (list_duplicates(output_vars))
             )
         # make sure the input & output variables are disjoint
-        if list_intersection(input_vars, output_vars):
-            raise IncompatibleArgsError(
-                "The following variables appear in inputs and outputs: %s"
-                % (list_intersection(input_vars, output_vars))
-            )
+        shared_vars = [var for var in input_vars if var in output_set]
+        if shared_vars:
+            raise IncompatibleArgsError("The following variables appear in inputs and outputs: %s" % (shared_vars))
         # make sure the assumptions only contain input variables
-        if list_diff(assumptions.vars, input_vars):
+        if not input_set.issuperset(assumptions.vars_set):
             raise IncompatibleArgsError(
                 "The following variables appear in the assumptions but are not inputs: %s"
-                % (list_diff(assumptions.vars, input_vars))
+                % ([var for var in assumptions.vars if var not in input_set])
             )
         # make sure the guarantees only contain input or output variables
-        if list_diff(guarantees.vars, list_union(input_vars, output_vars)):
+        io_set = input_set | output_set
+        if not io_set.issuperset(guarantees.vars_set):
             raise IncompatibleArgsError(
                 "The guarantees contain the following variables which are neither"
                 "inputs nor outputs: %s. Inputs: %s. Outputs: %s. Guarantees: %s"
-                % (list_diff(guarantees.vars, list_union(input_vars, output_vars)), input_vars, output_vars, guarantees)
+                % ([var for var in guarantees.vars if var not in io_set], input_vars, output_vars, guarantees)
             )
 
         self.a: TermList_t = assumptions.copy()
         self.inputvars = input_vars.copy()
         self.outputvars = output_vars.copy()
+        # membership views of the IO profile, used by the IO checks
+        self._in_set = frozenset(input_set)
+        self._out_set = frozenset(output_set)
         if simplify:
             self.g = guarantees.simplify(self.a)
         else:
@@ -433,24 +568,13 @@ class IoContract(Generic[TermList_t]):
         Returns:
             Input and output variables of the contract.
         """
-        return list_union(self.inputvars, self.outputvars)
+        # the constructor ensures that inputs and outputs are disjoint
+        return self.inputvars + self.outputvars
 
     def __str__(self) -> str:
-        return (
-            "InVars: "
-            + "["
-            + ", ".join([v.name for v in self.inputvars])
-            + "]"
-            + "\nOutVars:"
-            + "["
-            + ", ".join([v.name for v in self.outputvars])
-            + "]"
-            + "\nA: "
-            + str(self.a)
-            + "\n"
-            + "G: "
-            + str(self.g)
-        )
+        inputs = ", ".join(map(str, self.inputvars))
+        outputs = ", ".join(map(str, self.outputvars))
+        return f"InVars: [{inputs}]\nOutVars:[{outputs}]\nA: {self.a}\nG: {self.g}"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -465,9 +589,7 @@ class IoContract(Generic[TermList_t]):
     def __hash__(self) -> int:
         return hash((tuple(self.inputvars), tuple(self.outputvars), self.a, self.g))
 
-    def rename_variable(  # noqa: WPS231 too much cognitive complexity
-        self: IoContract_t, source_var: Var, target_var: Var
-    ) -> IoContract_t:
+    def rename_variable(self: IoContract_t, source_var: Var, target_var: Var) -> IoContract_t:
         """
         Rename a variable in a contract.
 
@@ -481,11 +603,21 @@ class IoContract(Generic[TermList_t]):
         Raises:
             IncompatibleArgsError: The new variable is both an input and output of the resulting contract.
         """
+        return self._rename_variables([(source_var, target_var)])
+
+    def _rename_variables(  # noqa: WPS231 too much cognitive complexity
+        self: IoContract_t, variable_mappings: List[Tuple[Var, Var]]
+    ) -> IoContract_t:
+        # Apply the renamings in order to the IO lists and termlists, and build a
+        # single contract at the end rather than one per renaming.
+        # the constructor copies its arguments
         inputvars = self.inputvars.copy()
         outputvars = self.outputvars.copy()
-        assumptions = self.a.copy()
-        guarantees = self.g.copy()
-        if source_var != target_var:
+        assumptions = self.a
+        guarantees = self.g
+        for source_var, target_var in variable_mappings:
+            if source_var == target_var:
+                continue
             if source_var in inputvars:
                 if target_var in outputvars:
                     raise IncompatibleArgsError("Making variable %s both an input and output" % (target_var))
@@ -513,11 +645,8 @@ class IoContract(Generic[TermList_t]):
         Returns:
             Copy of contract.
         """
-        inputvars = self.inputvars.copy()
-        outputvars = self.outputvars.copy()
-        assumptions = self.a.copy()
-        guarantees = self.g.copy()
-        return type(self)(assumptions, guarantees, inputvars, outputvars)
+        # the constructor copies its arguments
+        return type(self)(self.a, self.g, self.inputvars, self.outputvars)
 
     def __le__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -540,7 +669,7 @@ class IoContract(Generic[TermList_t]):
             True if the contracts can be composed. False otherwise.
         """
         # make sure lists of output variables don't intersect
-        return len(list_intersection(self.outputvars, other.outputvars)) == 0
+        return self._out_set.isdisjoint(other._out_set)
 
     def can_quotient_by(self: IoContract_t, other: IoContract_t) -> bool:
         """
@@ -555,8 +684,9 @@ class IoContract(Generic[TermList_t]):
         """
         # make sure the top level outputs not contained in outputs of the
         # existing component do not intersect with the inputs of the existing
-        # component
-        return len(list_intersection(list_diff(self.outputvars, other.outputvars), other.inputvars)) == 0
+        # component; as inputs and outputs of a contract are disjoint, this means
+        # no top-level output is an input of the existing component
+        return self._out_set.isdisjoint(other._in_set)
 
     def shares_io_with(self: IoContract_t, other: IoContract_t) -> bool:
         """
@@ -568,7 +698,7 @@ class IoContract(Generic[TermList_t]):
         Returns:
             True if the contracts have the same IO profile.
         """
-        return lists_equal(self.inputvars, other.inputvars) & lists_equal(self.outputvars, other.outputvars)
+        return self._in_set == other._in_set and self._out_set == other._out_set
 
     def refines(self: IoContract_t, other: IoContract_t) -> bool:
         """
@@ -585,6 +715,8 @@ class IoContract(Generic[TermList_t]):
         Raises:
             IncompatibleArgsError: Refinement cannot be computed.
         """
+        if self is other:
+            return True
         if not self.shares_io_with(other):
             raise IncompatibleArgsError("Contracts do not share IO")
         assumptions_check: bool = other.a <= self.a
@@ -623,7 +755,7 @@ class IoContract(Generic[TermList_t]):
         other: IoContract_t,
         vars_to_keep: Any = None,
         simplify: bool = True,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[IoContract_t, List[TacticStatistics]]:  # noqa: WPS231
         """Compose IO contracts with support for specifying the order of tactics and measuring their use.
 
@@ -649,39 +781,53 @@ class IoContract(Generic[TermList_t]):
             IncompatibleArgsError: An error occurred during composition.
         """
         if tactics_order is None:
-            tactics_order = []
+            tactics_order = ()
         if vars_to_keep is None:
             vars_to_keep = []
-        conflict_vars = list_diff(vars_to_keep, list_union(self.outputvars, other.outputvars))
+        # The variable lists are derived with set membership tests against the IO
+        # sets of both contracts; the lists keep the order of the arguments.
+        all_outputs = self.outputvars + [var for var in other.outputvars if var not in self._out_set]
+        output_set = self._out_set | other._out_set
+        conflict_vars = [var for var in vars_to_keep if var not in output_set]
         if conflict_vars:
             raise IncompatibleArgsError("Asked to keep variables %s, which are not outputs" % (conflict_vars))
 
         logging.debug("Composing contracts \n%s and \n%s", self, other)
-        intvars = list_union(
-            list_intersection(self.outputvars, other.inputvars), list_intersection(self.inputvars, other.outputvars)
-        )
-        inputvars = list_diff(list_union(self.inputvars, other.inputvars), intvars)
-        outputvars = list_diff(list_union(self.outputvars, other.outputvars), intvars)
+        # the connections between the contracts are computed once and reused below
+        self_feeds_other = [var for var in self.outputvars if var in other._in_set]
+        other_feeds_self = [var for var in self.inputvars if var in other._out_set]
+        # the connections are disjoint: one holds outputs and the other inputs of self
+        connected = frozenset(self_feeds_other).union(other_feeds_self)
+        inputvars = [var for var in self.inputvars if var not in connected] + [
+            var for var in other.inputvars if var not in connected and var not in self._in_set
+        ]
+        outputvars = [var for var in all_outputs if var not in connected]
         # remove requested variables
-        intvars = list_diff(intvars, vars_to_keep)
-        outputvars = list_union(outputvars, vars_to_keep)
-
-        selfinputconst = self.a.vars
-        otherinputconst = other.a.vars
-        cycle_present = (
-            len(list_intersection(self.inputvars, other.outputvars)) > 0
-            and len(list_intersection(other.inputvars, self.outputvars)) > 0
-        )
+        keep_set = frozenset(vars_to_keep)
+        intvars = [var for var in self_feeds_other + other_feeds_self if var not in keep_set]
+        outputvars += [var for var in vars_to_keep if var in connected]
+
+        cycle_present = bool(other_feeds_self) and bool(self_feeds_other)
 
-        assumptions_forbidden_vars = list_union(intvars, outputvars)
+        # intvars and outputvars partition the outputs of both contracts
+        assumptions_forbidden_vars = all_outputs
         if not self.can_compose_with(other):
             raise IncompatibleArgsError(
                 "Cannot compose the following contracts due to incompatible IO profiles:\n %s \n %s" % (self, other)
             )
-        other_helps_self = len(list_intersection(other.outputvars, self.inputvars)) > 0
-        self_helps_other = len(list_intersection(other.inputvars, self.outputvars)) > 0
-        other_drives_const_inputs = len(list_intersection(other.outputvars, selfinputconst)) > 0
-        self_drives_const_inputs = len(list_intersection(self.outputvars, otherinputconst)) > 0
+        if not self_feeds_other and not other_feeds_self:
+            # The contracts are not connected: there is nothing to eliminate, so
+            # the composition is the conjunction of assumptions and guarantees.
+            logging.debug("Contracts are not connected")
+            assumptions = self.a | other.a
+            if simplify:
+                assumptions = assumptions.simplify()
+            return type(self)(assumptions, self.g | other.g, inputvars, outputvars), []
+        other_helps_self = bool(other_feeds_self)
+        self_helps_other = bool(self_feeds_other)
+        # emptiness tests only need to find one shared variable
+        other_drives_const_inputs = not self.a.vars_set.isdisjoint(other._out_set)
+        self_drives_const_inputs = not other.a.vars_set.isdisjoint(self._out_set)
 
         tactics_used: List[TacticStatistics] = []
         # process assumptions
@@ -693,8 +839,7 @@ class IoContract(Generic[TermList_t]):
                 self.a | self.g, assumptions_forbidden_vars, simplify=True, tactics_order=tactics_order
             )
             tactics_used.append(used)
-            conflict_variables = list_intersection(new_a.vars, assumptions_forbidden_vars)
-            if conflict_variables:
+            if not lists_disjoint(new_a.vars, assumptions_forbidden_vars):
                 raise IncompatibleArgsError(
                     "Could not eliminate variables {}\n".format([str(x) for x in assumptions_forbidden_vars])
                     + "by refining the assumptions \n{}\n".format(new_a.get_terms_with_vars(assumptions_forbidden_vars))
@@ -707,8 +852,7 @@ class IoContract(Generic[TermList_t]):
                 other.a | other.g, assumptions_forbidden_vars, simplify=True, tactics_order=tactics_order
             )
             tactics_used.append(used)
-            conflict_variables = list_intersection(new_a.vars, assumptions_forbidden_vars)
-            if conflict_variables:
+            if not lists_disjoint(new_a.vars, assumptions_forbidden_vars):
                 raise IncompatibleArgsError(
                     "Could not eliminate variables {}".format([str(x) for x in assumptions_forbidden_vars])
                     + " by refining the assumptions \n{}\n".format(
@@ -727,21 +871,29 @@ class IoContract(Generic[TermList_t]):
 
         # process guarantees
         logging.debug("****** Computing guarantees")
-        g1_t = self.g.copy()
-        g2_t = other.g.copy()
-        (g1, used) = g1_t.elim_vars_by_relaxing(g2_t, intvars, simplify, tactics_order)
+        if not intvars:
+            # all connections are kept as outputs: there is nothing to eliminate
+            # from the guarantees, and the constructor simplifies them once
+            return type(self)(assumptions, self.g | other.g, inputvars, outputvars), tactics_used
+        (g1, used) = self.g.elim_vars_by_relaxing(other.g, intvars, simplify, tactics_order)
         tactics_used.append(used)
-        (g2, used) = g2_t.elim_vars_by_relaxing(g1_t, intvars, simplify, tactics_order)
+        (g2, used) = other.g.elim_vars_by_relaxing(self.g, intvars, simplify, tactics_order)
         tactics_used.append(used)
         allguarantees = g1 | g2
         (allguarantees, used) = allguarantees.elim_vars_by_relaxing(assumptions, intvars, simplify, tactics_order)
         tactics_used.append(used)
 
         # eliminate terms with forbidden vars
-        terms_to_elim = allguarantees.get_terms_with_vars(intvars)
-        allguarantees -= terms_to_elim
+        allguarantees = allguarantees.remove_terms_with_vars(intvars)
 
-        return type(self)(assumptions, allguarantees, inputvars, outputvars), tactics_used
+        # When simplifying, the last relaxation above already ended by simplifying
+        # the guarantees in the context of the assumptions, and dropping terms
+        # cannot make the remaining ones redundant. The constructor need not
+        # simplify them again.
+        return (
+            type(self)(assumptions, allguarantees, inputvars, outputvars, simplify=not simplify),
+            tactics_used,
+        )
 
     def quotient(
         self: IoContract_t,
@@ -777,7 +929,7 @@ class IoContract(Generic[TermList_t]):
         other: IoContract_t,
         additional_inputs: Optional[List[Var]] = None,
         simplify: bool = True,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[IoContract_t, List[TacticStatistics]]:
         """Compute the contract quotient with support for specifying the order of tactics and measuring their use.
 
@@ -805,30 +957,37 @@ class IoContract(Generic[TermList_t]):
             IncompatibleArgsError: Arguments provided are incompatible with computation of the quotient.
         """
         if tactics_order is None:
-            tactics_order = []
+            tactics_order = ()
         if not additional_inputs:
             additional_inputs = []
         if not self.can_quotient_by(other):
             raise IncompatibleArgsError("Contracts cannot be quotiented due to incompatible IO")
-        if list_diff(additional_inputs, list_union(other.outputvars, self.inputvars)):
+        # as in compose, membership is tested against the IO sets of both contracts
+        unknown_inputs = [var for var in additional_inputs if var not in other._out_set and var not in self._in_set]
+        if unknown_inputs:
             raise IncompatibleArgsError(
                 "The additional inputs %s are neither top level inputs nor existing component outputs"
-                % (list_diff(additional_inputs, list_union(other.outputvars, self.inputvars)))
+                % (unknown_inputs)
             )
         outputvars = list_union(
-            list_diff(self.outputvars, other.outputvars), list_diff(other.inputvars, self.inputvars)
+            [var for var in self.outputvars if var not in other._out_set],
+            [var for var in other.inputvars if var not in self._in_set],
         )
-        inputvars = list_union(list_diff(self.inputvars, other.inputvars), list_diff(other.outputvars, self.outputvars))
-        inputvars = list_union(inputvars, additional_inputs)
-        intvars = list_union(
-            list_intersection(self.outputvars, other.outputvars), list_intersection(self.inputvars, other.inputvars)
+        inputvars = list_union(
+            [var for var in self.inputvars if var not in other._in_set],
+            [var for var in other.outputvars if var not in self._out_set],
         )
+        inputvars = list_union(inputvars, additional_inputs)
+        # shared outputs and shared inputs are disjoint
+        intvars = [var for var in self.outputvars if var in other._out_set] + [
+            var for var in self.inputvars if var in other._in_set
+        ]
         intvars = list_diff(intvars, additional_inputs)
 
         tactics_used: List[TacticStatistics] = []
         # get assumptions
         logging.debug("Computing quotient assumptions")
-        assumptions = copy.deepcopy(self.a)
+        assumptions = self.a.copy()
         empty_context = type(assumptions)([])
         if assumptions.refines(other.a):
             logging.debug("Extending top-level assumptions with divisor's guarantees")
@@ -848,7 +1007,7 @@ class IoContract(Generic[TermList_t]):
             tactics_used.append(used)
         except ValueError:
             guarantees = self.g
-        logging.debug("Guarantees are %s" % (guarantees))
+        logging.debug("Guarantees are %s", guarantees)
         logging.debug("Using system-level assumptions to aid quotient guarantees")
         guarantees = guarantees | other.a
         try:  # noqa: WPS229
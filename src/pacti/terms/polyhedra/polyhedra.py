@@ -7,9 +7,11 @@ $x_i$ are variables and the $a_i$ and $c$ are constants.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import sympy
@@ -21,12 +23,14 @@ from pacti.utils.lists import list_diff, list_intersection, list_union
 
 numeric = Union[int, float]
 
-TACTICS_ORDER = [1, 2, 3, 4, 5]  # noqa: WPS407
+TACTICS_ORDER: Tuple[int, ...] = (1, 2, 3, 4, 5)
 
 
 class PolyhedralTerm(Term):
     """Polyhedral terms are linear inequalities over a list of variables."""
 
+    __slots__ = ("_variables", "_constant", "_vars", "_var_set", "_hash")
+
     # Constructor: get (i) a dictionary whose keys are variables and whose
     # values are the coefficients of those variables in the term, and (b) a
     # constant. The term is assumed to be in the form \Sigma_i a_i v_i +
@@ -62,12 +66,21 @@ class PolyhedralTerm(Term):
                     raise ValueError("Unsupported argument type")
                 else:
                     variable_dict[key] = float(value)
-        self.variables = variable_dict
-        self.constant = float(constant)
+        # Terms are not modified after construction, so the variables they
+        # refer to are computed here once.
+        self._variables: Mapping[Var, float] = MappingProxyType(variable_dict)
+        self._constant = float(constant)
+        self._vars = list(variable_dict)
+        self._var_set = frozenset(variable_dict)
+        self._hash: Optional[int] = None
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             raise ValueError()
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
         match = self.variables.keys() == other.variables.keys()
         if match:
             for k, v in self.variables.items():
@@ -75,18 +88,24 @@ class PolyhedralTerm(Term):
         return match and np.equal(self.constant, other.constant)
 
     def __str__(self) -> str:
-        varlist = list(self.variables.items())
-        varlist.sort(key=lambda x: str(x[0]))
-        res = " + ".join([str(coeff) + "*" + var.name for var, coeff in varlist])
-        res += " <= " + str(self.constant)
-        return res
+        varlist = sorted(self.variables.items(), key=lambda x: x[0].name)
+        lhs = " + ".join(f"{coeff}*{var.name}" for var, coeff in varlist)
+        return f"{lhs} <= {self.constant}"
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        # computed on first use and kept, as terms do not change after construction
+        if self._hash is None:
+            self._hash = hash((frozenset(self.variables.items()), self.constant))
+        return self._hash
 
     def __repr__(self) -> str:
         return "<Term {0}>".format(self)
 
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[Var, float], float]]:
+        # The cached hash depends on the ids of the variables, which are specific
+        # to the process, so only the coefficients and the constant are pickled.
+        return (PolyhedralTerm, (dict(self._variables), self._constant))
+
     def __add__(self, other: object) -> PolyhedralTerm:
         if not isinstance(other, type(self)):
             raise ValueError()
@@ -103,7 +122,28 @@ class PolyhedralTerm(Term):
         Returns:
             Copy of term.
         """
-        return PolyhedralTerm(self.variables, self.constant)
+        # the coefficients were validated when self was built, and the
+        # read-only mapping holding them can be shared
+        that = PolyhedralTerm.__new__(PolyhedralTerm)
+        that._variables = self._variables
+        that._constant = self._constant
+        that._vars = self._vars
+        that._var_set = self._var_set
+        that._hash = self._hash
+        return that
+
+    @staticmethod
+    def _from_validated(variables: Dict[Var, float], constant: float) -> PolyhedralTerm:
+        # Build a term from coefficients that already satisfy the invariants of
+        # the constructor: Var keys, nonzero float values, and a float constant.
+        # The dictionary is owned by the new term.
+        that = PolyhedralTerm.__new__(PolyhedralTerm)
+        that._variables = MappingProxyType(variables)
+        that._constant = constant
+        that._vars = list(variables)
+        that._var_set = frozenset(variables)
+        that._hash = None
+        return that
 
     def rename_variable(self, source_var: Var, target_var: Var) -> PolyhedralTerm:
         """
@@ -116,13 +156,37 @@ class PolyhedralTerm(Term):
         Returns:
             A term with `source_var` replaced by `target_var`.
         """
-        new_term = self.copy()
-        if source_var in self.vars:
-            if target_var not in self.vars:
-                new_term.variables[target_var] = 0
-            new_term.variables[target_var] += new_term.variables[source_var]
-            new_term = new_term.remove_variable(source_var)
-        return new_term
+        if source_var not in self._var_set:
+            return self.copy()
+        variables = {var: coeff for var, coeff in self.variables.items() if var != source_var}
+        if target_var not in variables:
+            variables[target_var] = self.variables[source_var]
+            return PolyhedralTerm._from_validated(variables, self.constant)
+        # the coefficients may cancel out
+        variables[target_var] += self.variables[source_var]
+        return PolyhedralTerm(variables, self.constant)
+
+    @property
+    def variables(self) -> Mapping[Var, float]:
+        """
+        Coefficients of the variables appearing in the term.
+
+        Terms do not change after construction, so the mapping is read-only.
+
+        Returns:
+            A read-only mapping from variables to their nonzero coefficients.
+        """
+        return self._variables
+
+    @property
+    def constant(self) -> float:
+        """
+        Constant on the right of the inequality.
+
+        Returns:
+            The constant of the term.
+        """
+        return self._constant
 
     @property
     def vars(self) -> List[Var]:  # noqa: A003
@@ -135,10 +199,20 @@ class PolyhedralTerm(Term):
             $a$ and $b$ are nonzero.
 
         Returns:
-            List of variables referenced in term.
+            List of variables referenced in term. The list is computed at
+            construction and shared; callers must not modify it.
+        """
+        return self._vars
+
+    @property
+    def vars_set(self) -> FrozenSet[Var]:
+        """
+        Variables appearing in term with a nonzero coefficient, as a set.
+
+        Returns:
+            Frozenset of the variables referenced in term, computed at construction.
         """
-        varlist = self.variables.keys()
-        return list(varlist)
+        return self._var_set
 
     def contains_var(self, var_to_seek: Var) -> bool:
         """
@@ -151,7 +225,7 @@ class PolyhedralTerm(Term):
             `True` if the syntax of the term refers to the given variable;
                 `False` otherwise.
         """
-        return var_to_seek in self.vars
+        return var_to_seek in self._var_set
 
     def get_coefficient(self, var: Var) -> numeric:  # noqa: VNE002
         """
@@ -260,11 +334,8 @@ class PolyhedralTerm(Term):
         Returns:
             A new term with the variable eliminated.
         """
-        if self.contains_var(var):
-            that = self.copy()
-            that.variables.pop(var)
-            return that
-        return self.copy()
+        variables = {key: coeff for key, coeff in self.variables.items() if key != var}
+        return PolyhedralTerm._from_validated(variables, self.constant)
 
     def multiply(self, factor: numeric) -> PolyhedralTerm:
         """Multiplies a term by a constant factor.
@@ -501,9 +572,13 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         else:
             raise ValueError("PolyhedralTermList constructor argument must be a list of PolyhedralTerms.")
 
+    def _invalidate_caches(self) -> None:
+        super()._invalidate_caches()
+        self._str_list_cache: Optional[Tuple[str, ...]] = None
+
     def __str__(self) -> str:
         res = "[\n  "
-        res += "\n  ".join(self.to_str_list())
+        res += "\n  ".join(self._str_tuple())
         res += "\n]"
         return res
 
@@ -514,16 +589,25 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         """
         Convert termlist into a list of strings.
 
+        The strings are computed on first use and cached until `terms` is
+        reassigned; each call returns a new list.
+
         Returns:
             A list of strings corresponding to the terms of the termlist.
         """
-        str_list = []
-        ts = self.terms.copy()
-        while ts:
-            s, rest = serializer.polyhedral_term_list_to_strings(ts)
-            str_list.append(s)
-            ts = rest
-        return str_list
+        return list(self._str_tuple())
+
+    def _str_tuple(self) -> Tuple[str, ...]:
+        if self._str_list_cache is None:
+            str_list = []
+            # polyhedral_term_list_to_strings does not modify its argument
+            ts = self.terms
+            while ts:
+                s, rest = serializer.polyhedral_term_list_to_strings(ts)
+                str_list.append(s)
+                ts = rest
+            self._str_list_cache = tuple(str_list)
+        return self._str_list_cache
 
     def evaluate(self, var_values: Dict[Var, numeric]) -> PolyhedralTermList:  # noqa: WPS231
         """
@@ -554,7 +638,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                 else:
                     continue  # noqa: WPS503
             new_list.append(new_term)
-        return PolyhedralTermList(new_list)
+        return PolyhedralTermList._from_owned(new_list)
 
     def contains_behavior(self, behavior: Dict[Var, numeric]) -> bool:
         """
@@ -585,7 +669,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         context: PolyhedralTermList,
         vars_to_elim: list,
         simplify: bool = True,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[PolyhedralTermList, TacticStatistics]:
         """
         Eliminate variables from PolyhedralTermList by refining it in context.
@@ -656,7 +740,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         context: PolyhedralTermList,
         vars_to_elim: list,
         simplify: bool = True,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[PolyhedralTermList, TacticStatistics]:
         """
         Eliminate variables from PolyhedralTermList by abstracting it in context.
@@ -715,9 +799,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                 + "was not possible"
             ) from e
         # eliminate terms containing the variables to be eliminated
-        terms_to_elim = termlist.get_terms_with_vars(vars_to_elim)
-        termlist.terms = list_diff(termlist.terms, terms_to_elim.terms)
-        return termlist, tactics_data
+        return termlist.remove_terms_with_vars(vars_to_elim), tactics_data
 
     def simplify(self, context: Optional[PolyhedralTermList] = None) -> PolyhedralTermList:
         """
@@ -743,26 +825,39 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Context: %s", context)
         if context:
             new_self = self - context
-            result = PolyhedralTermList.termlist_to_polytope(new_self, context)
+            context_terms = tuple(context.terms)
+            variables = list_union(new_self.vars, context.vars)
         else:
-            result = PolyhedralTermList.termlist_to_polytope(self, PolyhedralTermList())
-
-        variables = result[0]
-        self_mat = result[1]
-        self_cons = result[2]
-        ctx_mat = result[3]
-        ctx_cons = result[4]
-        # logging.debug("Polytope is \n%s", self_mat)
+            new_self = self
+            context_terms = ()
+            variables = new_self.vars
+        # The variable order is part of the key because it fixes the columns of the
+        # polytope, and thus the form of the simplified terms.
         try:
-            a_red, b_red = PolyhedralTermList.reduce_polytope(self_mat, self_cons, ctx_mat, ctx_cons)
+            simplified = PolyhedralTermList._simplify_terms(tuple(new_self.terms), context_terms, tuple(variables))
         except ValueError as e:
             raise ValueError(
                 "The constraints \n{}\n".format(self) + "are unsatisfiable in context \n{}".format(context)
             ) from e
-        logging.debug("Reduction: \n%s", a_red)
-        simplified = PolyhedralTermList.polytope_to_termlist(a_red, b_red, variables)
-        logging.debug("Back to terms: \n%s", simplified)
-        return simplified
+        result = PolyhedralTermList._from_owned(list(simplified))
+        logging.debug("Simplified terms: %s", result)
+        return result
+
+    # The cache is process-wide and holds strong references to its terms and
+    # their variables, so it is kept small.
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _simplify_terms(
+        terms: Tuple[PolyhedralTerm, ...], context: Tuple[PolyhedralTerm, ...], variables: Tuple[Var, ...]
+    ) -> Tuple[PolyhedralTerm, ...]:
+        # Terms are immutable, so simplification results are memoized: compositions
+        # and quotients often simplify the same terms in the same context.
+        _, self_mat, self_cons, ctx_mat, ctx_cons = PolyhedralTermList.termlist_to_polytope(  # noqa: WPS236
+            PolyhedralTermList._from_owned(list(terms)), PolyhedralTermList._from_owned(list(context))
+        )
+        a_red, b_red = PolyhedralTermList.reduce_polytope(self_mat, self_cons, ctx_mat, ctx_cons)
+        simplified = PolyhedralTermList.polytope_to_termlist(a_red, b_red, list(variables))
+        return tuple(simplified.terms)
 
     def refines(self, other: PolyhedralTermList) -> bool:
         """
@@ -778,6 +873,11 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Verifying refinement")
         logging.debug("LH term: %s", self)
         logging.debug("RH term: %s", other)
+        if self is other:
+            return True
+        # self refines other if it contains every constraint of other
+        if set(self.terms).issuperset(other.terms):
+            return True
         if other.lacks_constraints():
             return True
         if self.lacks_constraints():
@@ -795,9 +895,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         Returns:
             True if constraints cannot be satisfied.
         """
-        _, self_mat, self_cons, _, _ = PolyhedralTermList.termlist_to_polytope(  # noqa: WPS236
-            self, PolyhedralTermList([])
-        )
+        _, self_mat, self_cons, _, _ = PolyhedralTermList.termlist_to_polytope(self)  # noqa: WPS236
         logging.debug("Polytope is \n%s", self_mat)
         return PolyhedralTermList.is_polytope_empty(self_mat, self_cons)
 
@@ -810,41 +908,45 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         vars_to_elim: list,
         refine: bool,
         simplify: bool,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[PolyhedralTermList, TacticStatistics]:
         logging.debug("Transforming: %s", self)
         logging.debug("Context terms: %s", context)
         logging.debug("Variables to eliminate: %s", vars_to_elim)
         if tactics_order is None:
             tactics_order = TACTICS_ORDER
-        term_list = list(self.terms)
-        new_terms = self.copy()
 
         # List to store the tuples of the tactic used, time spent, and invocation count
         tactics_used: TacticStatistics = []
 
+        elim_set = frozenset(vars_to_elim)
+        if elim_set.isdisjoint(self.vars_set):
+            # no term refers to the variables to eliminate: there is nothing to rebuild
+            logging.debug("No term to transform")
+            if simplify:
+                return self.simplify(context), tactics_used
+            return self.copy(), tactics_used
+
+        term_list = self.terms
+        new_terms = list(term_list)
         for i, term in enumerate(term_list):
-            if list_intersection(term.vars, vars_to_elim):
-                copy_new_terms = new_terms.copy()
-                copy_new_terms.terms.remove(term)
-                helpers = context | copy_new_terms
+            if not elim_set.isdisjoint(term._var_set):
+                other_terms = list(new_terms)
+                other_terms.remove(term)
+                helpers = context | PolyhedralTermList._from_owned(other_terms)
                 try:
                     (new_term, tactic_num, tactic_time, tactic_count) = PolyhedralTermList._transform_term(
                         term, helpers, vars_to_elim, refine, tactics_order
                     )
                 except ValueError:
-                    new_term = term.copy()
+                    new_term = term
                     tactic_num = 0
                     tactic_time = 0
                     tactic_count = 0
                 tactics_used.append((tactic_num, tactic_time, tactic_count))
+                new_terms[i] = new_term
 
-            else:
-                new_term = term.copy()
-
-            new_terms.terms[i] = new_term
-
-        that = PolyhedralTermList(new_terms.terms)
+        that = PolyhedralTermList._from_owned(new_terms)
 
         # the last step needs to be a simplification
         logging.debug("Ending transformation with simplification")
@@ -889,7 +991,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
 
     @staticmethod
     def termlist_to_polytope(
-        terms: PolyhedralTermList, context: PolyhedralTermList
+        terms: PolyhedralTermList, context: Optional[PolyhedralTermList] = None
     ) -> Tuple[List[Var], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
         Converts a list of terms with its context into matrix-vector pairs.
@@ -911,33 +1013,36 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             terms:
                 list of terms to convert to matrix-vector form.
             context:
-                Context terms to convert to matrix-vector form.
+                Context terms to convert to matrix-vector form. None stands for
+                an empty context.
 
         Returns:
             A tuple `variables, A, b, a_h, b_h` consisting of the variable
                 order and the matrix-vector pairs for the terms and the context.
         """
-        variables = list(list_union(terms.vars, context.vars))
-        a = []
-        b = []
-        for term in terms.terms:
-            pol, coeff = PolyhedralTerm.term_to_polytope(term, variables)
-            a.append(pol)
-            b.append(coeff)
-
-        a_h = []
-        b_h = []
-        for term in context.terms:
-            pol, coeff = PolyhedralTerm.term_to_polytope(term, variables)
-            a_h.append(pol)
-            b_h.append(coeff)
-
-        if len(context.terms) == 0:
-            a_h_ret = np.array([[]])
-        else:
-            a_h_ret = np.array(a_h)
-        # logging.debug("a is \n%s", a)
-        return variables, np.array(a), np.array(b), a_h_ret, np.array(b_h)
+        if context is None or not context.terms:
+            variables = list(terms.vars)
+            var_index = {var: i for i, var in enumerate(variables)}
+            a, b = PolyhedralTermList._terms_to_matrix(terms.terms, var_index)
+            return variables, a, b, np.array([[]]), np.array([])
+        variables = list_union(terms.vars, context.vars)
+        var_index = {var: i for i, var in enumerate(variables)}
+        a, b = PolyhedralTermList._terms_to_matrix(terms.terms, var_index)
+        a_h, b_h = PolyhedralTermList._terms_to_matrix(context.terms, var_index)
+        return variables, a, b, a_h, b_h
+
+    @staticmethod
+    def _terms_to_matrix(terms: List[PolyhedralTerm], var_index: Dict[Var, int]) -> Tuple[np.ndarray, np.ndarray]:
+        # Fill a zero matrix with the nonzero coefficients of each term, using
+        # var_index for the column of each variable.
+        if not terms:
+            return np.array([]), np.array([])
+        matrix = np.zeros((len(terms), len(var_index)))
+        for i, term in enumerate(terms):
+            row = matrix[i]
+            for var, coeff in term.variables.items():  # noqa: VNE002
+                row[var_index[var]] = coeff
+        return matrix, np.array([term.constant for term in terms])
 
     @staticmethod
     def polytope_to_termlist(matrix: np.ndarray, vector: np.ndarray, variables: List[Var]) -> PolyhedralTermList:
@@ -970,7 +1075,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             const = vector[i]
             term = PolyhedralTerm.polytope_to_term(row, const, variables)
             term_list.append(term)
-        return PolyhedralTermList(list(term_list))
+        return PolyhedralTermList._from_owned(term_list)
 
     @staticmethod
     def reduce_polytope(  # noqa: WPS231
@@ -1169,6 +1274,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
     ) -> Tuple[List[PolyhedralTerm], List[Var]]:
         forbidden_vars = list_intersection(vars_to_elim, term.vars)
         other_forbibben_vars = list_diff(vars_to_elim, term.vars)
+        forbidden_set = frozenset(forbidden_vars)
         n = len(forbidden_vars)
         matrix_row_terms = []  # type: List[PolyhedralTerm]
         partial_sums = [float(0) for i in range(n)]
@@ -1222,8 +1328,8 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                         # logging.debug("Failed third matrix-vector verification")
                         break
                 if not term_is_invalid:
-                    matrix_contains_others = (
-                        matrix_contains_others or len(list_diff(context_term.vars, forbidden_vars)) > 0
+                    matrix_contains_others = matrix_contains_others or not forbidden_set.issuperset(
+                        context_term._var_set
                     )
                     row_found = True
                     for j in range(n):
@@ -1232,7 +1338,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                     break
             if not row_found:
                 raise ValueError("Could not find the {}th row of matrix".format(i))
-        if (not matrix_contains_others) and len(list_diff(term.vars, vars_to_elim)) == 0:
+        if (not matrix_contains_others) and frozenset(vars_to_elim).issuperset(term._var_set):
             raise ValueError("Found context will produce empty transformation")
         # logging.debug("Matrix row terms %s", matrix_row_terms)
         return matrix_row_terms, forbidden_vars
@@ -1242,7 +1348,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         term: PolyhedralTerm, context: PolyhedralTermList, vars_to_elim: list, refine: bool, strategy: int
     ) -> PolyhedralTerm:
         logging.debug("********** Context reduction")
-        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s " % (vars_to_elim, term, context))
+        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s ", vars_to_elim, term, context)
         try:
             if strategy == 1:
                 matrix_row_terms, forbidden_vars = PolyhedralTermList._get_kaykobad_context(
@@ -1257,7 +1363,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         except ValueError:
             logging.debug("Could not transform %s using Context reduction", term)
             raise ValueError("Could not transform term {}".format(term))
-        matrix_row_terms_tl = PolyhedralTermList(list(matrix_row_terms))
+        matrix_row_terms_tl = PolyhedralTermList._from_owned(list(matrix_row_terms))
         sols = PolyhedralTerm.solve_for_variables(matrix_row_terms_tl, list(forbidden_vars))
         # logging.debug("Sols %s", sols)
 
@@ -1281,23 +1387,26 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         term: PolyhedralTerm, context: PolyhedralTermList, vars_to_elim: list, refine: bool
     ) -> Tuple[Optional[PolyhedralTerm], int]:
         logging.debug("************ Tactic 2")
-        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s " % (vars_to_elim, term, context))
+        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s ", vars_to_elim, term, context)
         conflict_vars = list_intersection(vars_to_elim, term.vars)
+        elim_set = frozenset(vars_to_elim)
         new_context_list = []
         # Extract from context the terms that only contain forbidden vars
         for context_term in context.terms:
-            if not list_diff(context_term.vars, vars_to_elim):
+            if elim_set.issuperset(context_term._var_set):
                 if context_term != term:
-                    new_context_list.append(context_term.copy())
-        logging.debug("This is what we kept")
-        for el in new_context_list:
-            logging.debug(el)
+                    new_context_list.append(context_term)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("This is what we kept")
+            for el in new_context_list:
+                logging.debug(el)
         if not new_context_list:
             raise ValueError("No term contains only irrelevant variables")
-        if list_diff(conflict_vars, PolyhedralTermList(new_context_list).vars):
+        new_context = PolyhedralTermList._from_owned(new_context_list)
+        if list_diff(conflict_vars, new_context.vars):
             raise ValueError("Tactic 2 unsuccessful")
         # now optimize
-        retval = PolyhedralTermList.termlist_to_polytope(PolyhedralTermList(new_context_list), PolyhedralTermList([]))
+        retval = PolyhedralTermList.termlist_to_polytope(new_context)
         variables = retval[0]
         new_context_mat = retval[1]
         new_context_cons = retval[2]
@@ -1315,10 +1424,8 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             raise ValueError("Tactic 2 did not succeed")
         replacement = polarity * res["fun"]
         # replace the irrelevant variables with new findings in term
-        result = term.copy()
-        for var in vars_to_elim:  # noqa: VNE002
-            result = result.remove_variable(var)
-        result.constant -= replacement
+        kept_coeffs = {var: coeff for var, coeff in term.variables.items() if var not in elim_set}
+        result = PolyhedralTerm._from_validated(kept_coeffs, float(term.constant - replacement))
         # check vacuity
         if not result.vars:
             return term.copy(), 1
@@ -1329,21 +1436,20 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         term: PolyhedralTerm, context: PolyhedralTermList, vars_to_elim: list, refine: bool
     ) -> Tuple[Optional[PolyhedralTerm], int]:
         logging.debug("************ Tactic 3")
-        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s " % (vars_to_elim, term, context))
+        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s ", vars_to_elim, term, context)
         conflict_vars = list_intersection(vars_to_elim, term.vars)
         conflict_coeff = {var: term.get_coefficient(var) for var in conflict_vars}
-        new_term = term.copy()
-        for var in conflict_vars:  # noqa: VNE002 variable name 'var' should be clarified
-            new_term = new_term.remove_variable(var)
-        new_term.variables[Var("_")] = 1
+        new_term_vars = {var: coeff for var, coeff in term.variables.items() if var not in conflict_vars}
+        new_term_vars[Var("_")] = 1
+        new_term = PolyhedralTerm(new_term_vars, term.constant)
         # modify the context
         subst_term_vars = {Var("_"): 1.0 / conflict_coeff[conflict_vars[0]]}
         for var in conflict_vars:  # noqa: VNE002 variable name 'var' should be clarified
             if var != conflict_vars[0]:
                 subst_term_vars[var] = -conflict_coeff[var] / conflict_coeff[conflict_vars[0]]
         subst_term = PolyhedralTerm(variables=subst_term_vars, constant=0)
-        new_context = PolyhedralTermList(
-            [el.copy().substitute_variable(conflict_vars[0], subst_term) for el in context.terms]
+        new_context = PolyhedralTermList._from_owned(
+            [el.substitute_variable(conflict_vars[0], subst_term) for el in context.terms]
         )
         # now we use tactic 1
         new_elims = list_diff(list_union(vars_to_elim, [Var("_")]), [conflict_vars[0]])
@@ -1352,7 +1458,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         except ValueError as e:  # noqa: WPS329 Found useless `except` case
             raise e
         logging.debug("************ Leaving Tactic 3")
-        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s " % (vars_to_elim, term, context))
+        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s ", vars_to_elim, term, context)
         return result, count
 
     @staticmethod
@@ -1360,7 +1466,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         term: PolyhedralTerm, context: PolyhedralTermList, vars_to_elim: list, refine: bool, no_vars: List[Var]
     ) -> Tuple[Optional[PolyhedralTerm], int]:
         logging.debug("************ Tactic 4")
-        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s " % (vars_to_elim, term, context))
+        logging.debug("Vars_to_elim %s \nTerm %s \nContext %s ", vars_to_elim, term, context)
         if not refine:
             raise ValueError("Only refinement is supported")
 
@@ -1376,12 +1482,14 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         if refine:
             polarity = 1
 
+        no_vars_set = frozenset(no_vars)
+        elim_set = frozenset(vars_to_elim)
         for context_term in context.terms:
-            if list_intersection(context_term.vars, no_vars):
+            if not no_vars_set.isdisjoint(context_term._var_set):
                 continue
             coeff = context_term.get_coefficient(var_to_elim)
             if coeff != 0 and polarity * coeff * term.get_coefficient(var_to_elim) > 0:
-                temp_conflict_vars = list_intersection(context_term.vars, vars_to_elim)
+                temp_conflict_vars = [var for var in context_term.vars if var in elim_set]
                 if len(temp_conflict_vars) == 1:
                     goal_context.append(context_term.copy())
                 if len(temp_conflict_vars) == 2:
@@ -1397,8 +1505,9 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
 
         ############
         for useful_term in useful_context:
-            new_context = context.copy()
-            new_context.terms.remove(useful_term)
+            new_context_terms = list(context.terms)
+            new_context_terms.remove(useful_term)
+            new_context = PolyhedralTermList._from_owned(new_context_terms)
             new_term = useful_term.isolate_variable(var_to_elim)
             new_no_vars = no_vars.copy()
             new_no_vars.append(var_to_elim)
@@ -1422,10 +1531,9 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         forbidden_vars = list_intersection(vars_to_elim, term.vars)
         matrix_row_terms = []
 
-        var_list, B, b, _, _ = PolyhedralTermList.termlist_to_polytope(  # noqa: WPS236, N806
-            terms=context, context=PolyhedralTermList([])
-        )
-        objective = np.array([term.get_coefficient(var) if var in forbidden_vars else 0 for var in var_list])
+        var_list, B, b, _, _ = PolyhedralTermList.termlist_to_polytope(terms=context)  # noqa: WPS236, N806
+        forbidden_set = frozenset(forbidden_vars)
+        objective = np.array([term.get_coefficient(var) if var in forbidden_set else 0 for var in var_list])
         if refine:
             objective *= -1
 
@@ -1449,7 +1557,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         terms_added = 0
         for index in indices:
             context_term = context.terms[index]
-            if list_intersection(context_term.vars, forbidden_vars):
+            if not forbidden_set.isdisjoint(context_term._var_set):
                 matrix_row_terms.append(context_term)
                 terms_added += 1
                 if terms_added == num_vars_to_elim:
@@ -1494,12 +1602,12 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         context: PolyhedralTermList,
         vars_to_elim: list,
         refine: bool,
-        tactics_order: Optional[List[int]] = None,
+        tactics_order: Optional[Sequence[int]] = None,
     ) -> Tuple[PolyhedralTerm, int, float, int]:
         if tactics_order is None:
             tactics_order = TACTICS_ORDER
 
-        if not list_intersection(term.vars, vars_to_elim):
+        if frozenset(vars_to_elim).isdisjoint(term._var_set):
             raise ValueError("Irrelevant transform term call!")
 
         logging.debug("Transforming term: %s", term)
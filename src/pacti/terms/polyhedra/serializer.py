@@ -1,4 +1,5 @@
 """Transformations between polyhedral structures and strings."""
+import functools
 from typing import Dict, List, Tuple, Union
 
 import numpy as np
@@ -36,7 +37,6 @@ def validate_contract_dict(  # noqa: WPS231 too much cognitive complexity
         ContractFormatError: the provided contract is not well-formed.
     """
     if not isinstance(contract, dict):
-        print(contract)
         raise ContractFormatError("Each contract should be a dictionary")
     keywords = ["assumptions", "guarantees", "input_vars", "output_vars"]
     str_list_kw = ["input_vars", "output_vars"]
@@ -94,8 +94,7 @@ def _are_numbers_approximatively_equal(v1: numeric, v2: numeric) -> bool:
 
 
 def _lhs_str(term: PolyhedralTerm) -> str:  # noqa: WPS231
-    varlist = list(term.variables.items())
-    varlist.sort(key=lambda x: str(x[0]))
+    varlist = sorted(term.variables.items(), key=lambda x: x[0].name)
     # res = " + ".join([str(coeff) + "*" + var.name for var, coeff in varlist])
     # res += " <= " + str(self.constant)
     res = ""
@@ -131,13 +130,9 @@ def _lhs_str(term: PolyhedralTerm) -> str:  # noqa: WPS231
 # - same set of variables
 # - the variable coefficients of self are approximatively the negative of those of other.
 def _are_polyhedral_terms_opposite(self: PolyhedralTerm, other: PolyhedralTerm) -> bool:
-    for var in other.variables.keys():
-        if not self.contains_var(var):
-            return False
-
+    if self.vars_set != other.vars_set:
+        return False
     for var, value in self.variables.items():
-        if not other.contains_var(var):
-            return False
         if not _are_numbers_approximatively_equal(-value, other.variables[var]):
             return False
     return True
@@ -321,6 +316,13 @@ def polyhedral_termlist_from_string(str_rep: str) -> List[PolyhedralTerm]:
         PolyhedralSyntaxException: constraint syntax error w.r.t the polyhedral term grammar.
         ValueError: Number of tokens invalid.
     """
+    return list(_parse_polyhedral_terms(str_rep))
+
+
+# Terms are immutable, so the terms parsed from a string can be shared by every
+# contract that uses the same constraint.
+@functools.lru_cache(maxsize=4096)
+def _parse_polyhedral_terms(str_rep: str) -> Tuple[PolyhedralTerm, ...]:
     try:
         tokens: pp.ParseResults = expression.parse_string(str_rep, parse_all=True)
     except pp.ParseBaseException as pe:
@@ -329,6 +331,23 @@ def polyhedral_termlist_from_string(str_rep: str) -> List[PolyhedralTerm]:
     if len(tokens) == 1:
         e = tokens[0]
         if isinstance(e, PolyhedralSyntaxExpression):
-            return _expression_to_polyhedral_terms(str_rep, e)
+            return tuple(_expression_to_polyhedral_terms(str_rep, e))
 
     raise ValueError(f"Polyhedral term syntax unrecognized in: {str_rep}")
+
+
+def polyhedral_termlist_from_strings(str_reps: List[str]) -> List[PolyhedralTerm]:
+    """
+    Transform several linear expressions into one polyhedral termlist.
+
+    Args:
+        str_reps: The linear expressions passed as strings.
+
+    Returns:
+        The terms of all expressions, in order.
+    """
+    terms: List[PolyhedralTerm] = []
+    extend = terms.extend
+    for str_rep in str_reps:
+        extend(_parse_polyhedral_terms(str_rep))
+    return terms
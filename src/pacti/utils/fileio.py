@@ -74,10 +74,10 @@ def write_contracts_to_file(  # noqa: WPS231 too much cognitive complexity
     """
     data = []
     assert len(contracts) == len(names)
-    for i, c in enumerate(contracts):
+    for c, name in zip(contracts, names):
         entry: Dict[str, Any] = {}
         if isinstance(c, PolyhedralIoContract):
-            entry["name"] = names[i]
+            entry["name"] = name
             if machine_representation:
                 entry["type"] = "PolyhedralIoContract_machine"
                 entry["data"] = c.to_machine_dict()
@@ -86,7 +86,7 @@ def write_contracts_to_file(  # noqa: WPS231 too much cognitive complexity
                 entry["type"] = "PolyhedralIoContract"
                 entry["data"] = c.to_dict()
         elif isinstance(c, PolyhedralIoContractCompound):
-            entry["name"] = names[i]
+            entry["name"] = name
             if machine_representation:
                 raise ValueError("Unsupported representation")
             entry["type"] = "PolyhedralIoContractCompound"
@@ -97,4 +97,8 @@ def write_contracts_to_file(  # noqa: WPS231 too much cognitive complexity
         data.append(entry)
 
     with open(file_name, "w") as f:
-        f.write(json.dumps(data, indent=2))
+        if machine_representation:
+            # the machine representation is not meant to be read by humans
+            json.dump(data, f, separators=(",", ":"))
+        else:
+            json.dump(data, f, indent=2)
@@ -1,6 +1,11 @@
-"""Some list operations."""
+"""
+Some list operations.
 
-from typing import Any, List
+The lists are treated as ordered collections: results keep the order of the
+arguments. Membership is tested through sets, so elements must be hashable.
+"""
+
+from typing import Any, Dict, List
 
 
 def list_intersection(list1: List[Any], list2: List[Any]) -> List[Any]:
@@ -14,7 +19,10 @@ def list_intersection(list1: List[Any], list2: List[Any]) -> List[Any]:
     Returns:
         A list containing the intersection of both lists.
     """
-    return [el for el in list1 if el in list2]
+    if not list1 or not list2:
+        return []
+    members = set(list2)
+    return [el for el in list1 if el in members]
 
 
 def list_diff(list1: List[Any], list2: List[Any]) -> List[Any]:
@@ -28,7 +36,10 @@ def list_diff(list1: List[Any], list2: List[Any]) -> List[Any]:
     Returns:
         A list containing the elements of the first argument which do not belong to the second.
     """
-    return [el for el in list1 if (el not in list2)]
+    if not list2:
+        return list1.copy()
+    members = set(list2)
+    return [el for el in list1 if el not in members]
 
 
 def list_union(list1: List[Any], list2: List[Any]) -> List[Any]:
@@ -42,7 +53,45 @@ def list_union(list1: List[Any], list2: List[Any]) -> List[Any]:
     Returns:
         A list containing the elements that at least one list contains.
     """
-    return list1 + [el for el in list2 if (el not in list1)]
+    if not list2:
+        return list1.copy()
+    members = set(list1)
+    return list1 + [el for el in list2 if el not in members]
+
+
+def list_duplicates(list1: List[Any]) -> List[Any]:
+    """
+    Find the elements that appear more than once in a list.
+
+    Args:
+        list1: The list to inspect.
+
+    Returns:
+        The repeated elements, each listed once, in order of first repetition.
+    """
+    seen = set()
+    repeated: Dict[Any, None] = {}
+    for el in list1:
+        if el in seen:
+            repeated[el] = None
+        seen.add(el)
+    return list(repeated)
+
+
+def lists_disjoint(list1: List[Any], list2: List[Any]) -> bool:
+    """
+    Tells whether two lists have no elements in common.
+
+    Args:
+        list1: First argument.
+        list2: Second argument.
+
+    Returns:
+        True if no element of one list belongs to the other.
+    """
+    if len(list2) < len(list1):
+        list1, list2 = list2, list1
+    return set(list1).isdisjoint(list2)
 
 
 def lists_equal(list1: List[Any], list2: List[Any]) -> bool:
@@ -278,7 +278,7 @@ def constraints_to_vertices(
     plot_tl = _substitute_in_termlist(term_list, var_values)
     assert not list_diff(plot_tl.vars, [x_var, y_var]), "termlist vars: %s" % (plot_tl.vars)
     # Now we plot the polygon
-    res_tuple = PolyhedralTermList.termlist_to_polytope(plot_tl, PolyhedralTermList([]))
+    res_tuple = PolyhedralTermList.termlist_to_polytope(plot_tl)
     variables = res_tuple[0]
     a_mat = res_tuple[1]
     b = res_tuple[2]
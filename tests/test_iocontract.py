@@ -1,3 +1,6 @@
+import pickle
+import subprocess
+import sys
 from typing import List
 
 import pacti.iocontract as iocontract
@@ -32,3 +35,55 @@ def test_validate_iocontract() -> None:
 
 def test_contract_equality() -> None:
     pass
+
+
+def test_var_interning() -> None:
+    x = iocontract.Var("x")
+    assert x is iocontract.Var("x")
+    assert x == iocontract.Var("x")
+    assert hash(x) == hash(iocontract.Var("x"))
+    assert x != iocontract.Var("y")
+    assert len({x, iocontract.Var("x"), iocontract.Var("y")}) == 2
+
+
+PICKLE_CONTRACT_SCRIPT = """
+import pickle
+import sys
+
+from pacti.contracts import PolyhedralIoContract
+from pacti.iocontract import Var
+
+# create other variables first, so that x and y get different ids than here
+unused = [Var("v" + str(i)) for i in range(10)]
+contract = PolyhedralIoContract.from_strings(
+    input_vars=["x"], output_vars=["y"], assumptions=["x <= 1"], guarantees=["y - x <= 2"]
+)
+sys.stdout.buffer.write(pickle.dumps(contract))
+"""
+
+
+def test_pickle_across_processes() -> None:
+    x, y = iocontract.Var("x"), iocontract.Var("y")
+    var_set = {x, y}
+    pickled = subprocess.run([sys.executable, "-c", PICKLE_CONTRACT_SCRIPT], capture_output=True, check=True).stdout
+    contract = pickle.loads(pickled)
+    assert contract.inputvars[0] is x
+    assert contract.outputvars[0] is y
+    assert x in var_set and y in var_set
+    assert hash(x) == hash(iocontract.Var("x"))
+    expected = PolyhedralIoContract.from_strings(
+        input_vars=["x"], output_vars=["y"], assumptions=["x <= 1"], guarantees=["y - x <= 2"]
+    )
+    assert contract.inputvars == expected.inputvars and contract.outputvars == expected.outputvars
+    assert contract.a == expected.a
+    assert contract.g == expected.g
+
+
+def test_pickle_after_io_checks() -> None:
+    [c_1, c_2] = [PolyhedralIoContract.from_dict(c) for c in create_contracts(num=2)]
+    assert c_1.can_compose_with(c_2)
+    assert c_1.can_quotient_by(c_2)
+    assert not c_1.shares_io_with(c_2)
+    copied = pickle.loads(pickle.dumps(c_1))
+    assert copied.inputvars == c_1.inputvars and copied.outputvars == c_1.outputvars
+    assert copied.shares_io_with(c_1)
@@ -0,0 +1,8 @@
+from pacti.iocontract import Var
+from pacti.utils.lists import list_duplicates
+
+
+def test_list_duplicates() -> None:
+    x, y, z = Var("x"), Var("y"), Var("z")
+    assert list_duplicates([x, y, z]) == []
+    assert list_duplicates([y, x, y, z, x, y]) == [y, x]
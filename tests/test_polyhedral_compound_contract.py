@@ -2,6 +2,7 @@ import glob
 
 import pytest
 
+from pacti.contracts import PolyhedralIoContractCompound
 from pacti.utils import read_contracts_from_file
 
 TEST_DATA_DIR = "tests/test_data/compound_contracts"
@@ -46,6 +47,19 @@ def test_merging_failure(test_instance: str) -> None:
         _ = c[0].merge(c[1])
 
 
+def test_intersect_disjoint_supports() -> None:
+    c1 = PolyhedralIoContractCompound.from_strings(
+        input_vars=["x", "y"], output_vars=[], assumptions=[["x <= 1"], ["x >= 2", "x <= 1.5"]], guarantees=[[]]
+    )
+    c2 = PolyhedralIoContractCompound.from_strings(
+        input_vars=["y"], output_vars=[], assumptions=[["y <= -1"], ["y >= 1"]], guarantees=[[]]
+    )
+    merged = c1.merge(c2)
+    # the empty disjunct of c1 is dropped, and each remaining pair is kept
+    assert len(merged.a.nested_termlist) == 2
+    assert [str(tl) for tl in merged.a.nested_termlist] == ["[\n  x <= 1\n  y <= -1\n]", "[\n  x <= 1\n  -y <= -1\n]"]
+
+
 if __name__ == "__main__":
     file = "test_merging_success_multiagent_3.json"
     test_merging_success(file)
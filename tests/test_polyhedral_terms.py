@@ -148,5 +148,61 @@ def test_relaxing2() -> None:
     assert expected == transformed2
 
 
+def test_term_hash() -> None:
+    terms = to_pts(["2*x + 3*y <= 4", "3*y + 2*x <= 4", "2*x + 3*y <= 5", "2*x <= 0", "2*x <= -0"]).terms
+    assert terms[0] == terms[1]
+    assert hash(terms[0]) == hash(terms[1])
+    assert terms[0] != terms[2]
+    assert terms[3] == terms[4]
+    assert hash(terms[3]) == hash(terms[4])
+    assert len(set(terms)) == 3
+
+
+def test_refines_with_shared_terms() -> None:
+    constraints = to_pts(["x + y <= 1", "x - y <= 2", "-x <= 0"])
+    assert constraints <= to_pts(["-x <= 0", "x + y <= 1"])
+    assert constraints <= to_pts(["x <= 3"])
+    assert not to_pts(["-x <= 0", "x + y <= 1"]) <= constraints
+
+
+def test_termlist_set_operations() -> None:
+    left = to_pts(["x <= 1", "y <= 2", "x + y <= 3"])
+    right = to_pts(["x + y <= 3", "z <= 4", "x <= 1"])
+    assert left - right == to_pts(["y <= 2"])
+    assert right - left == to_pts(["z <= 4"])
+    assert left | right == to_pts(["x <= 1", "y <= 2", "x + y <= 3", "z <= 4"])
+    assert left & right == to_pts(["x <= 1", "x + y <= 3"])
+
+
+def test_remove_terms_with_vars() -> None:
+    constraints = to_pts(["x <= 1", "y <= 2", "x + z <= 3", "w <= 4"])
+    assert constraints.remove_terms_with_vars([Var("x")]) == to_pts(["y <= 2", "w <= 4"])
+    assert constraints.remove_terms_with_vars([Var("v")]) == constraints
+    assert constraints.remove_terms_with_vars([Var("x"), Var("w")]) == (
+        constraints - constraints.get_terms_with_vars([Var("x"), Var("w")])
+    )
+
+
+def test_to_str_list_follows_terms() -> None:
+    constraints = to_pts(["x <= 1", "y <= 2"])
+    str_list = constraints.to_str_list()
+    assert str_list == ["x <= 1", "y <= 2"]
+    str_list.append("z <= 3")
+    assert constraints.to_str_list() == ["x <= 1", "y <= 2"]
+    constraints.terms = constraints.terms[1:]
+    assert constraints.to_str_list() == ["y <= 2"]
+
+
+def test_parsed_terms_are_read_only() -> None:
+    term = polyhedral_termlist_from_string("2x + y <= 3")[0]
+    with pytest.raises(TypeError):
+        term.variables[Var("x")] = 5  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        term.constant = 4  # type: ignore[misc]
+    assert polyhedral_termlist_from_string("2x + y <= 3")[0] == term
+    assert term.variables == {Var("x"): 2, Var("y"): 1}
+    assert term.constant == 3
+
+
 if __name__ == "__main__":
     test_relaxing2()